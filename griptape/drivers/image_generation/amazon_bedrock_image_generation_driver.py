@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import json
-from typing import Optional, TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any
 
 from attr import define, field, Factory
 
 from griptape.artifacts import ImageArtifact
 from griptape.drivers import BaseMultiModelImageGenerationDriver
-from griptape.utils import import_optional_dependency
+from griptape.utils import import_optional_dependency, botocore_client_config
 
 if TYPE_CHECKING:
     import boto3
@@ -20,35 +20,108 @@ class AmazonBedrockImageGenerationDriver(BaseMultiModelImageGenerationDriver):
     Attributes:
         model: Bedrock model ID.
         session: boto3 session.
+        max_pool_connections: Size of the HTTP connection pool used by the default Bedrock runtime client.
         bedrock_client: Bedrock runtime client.
         image_width: Width of output images. Defaults to 512 and must be a multiple of 64.
         image_height: Height of output images. Defaults to 512 and must be a multiple of 64.
         seed: Optionally provide a consistent seed to generation requests, increasing consistency in output.
         image_generation_model_driver: Image Generation Model Driver to use.
+        async_session: aioboto3 session used by `atry_generate_image`. Defaults to one built from `session`'s region
+            and credentials when aioboto3 is installed.
 
     Details on Stable Diffusion image generation parameters can be found here:
     https://platform.stability.ai/docs/api-reference#tag/v1generation/operation/textToImage
     """
 
     session: boto3.Session = field(default=Factory(lambda: import_optional_dependency("boto3").Session()), kw_only=True)
+    max_pool_connections: int = field(default=50, kw_only=True)
     bedrock_client: Any = field(
-        default=Factory(lambda self: self.session.client(service_name="bedrock-runtime"), takes_self=True)
+        default=Factory(
+            lambda self: self.session.client(
+                service_name="bedrock-runtime",
+                config=botocore_client_config(self.max_pool_connections, retries={"total_max_attempts": 1}),
+            ),
+            takes_self=True,
+        )
     )
     image_width: int = field(default=512, kw_only=True)
     image_height: int = field(default=512, kw_only=True)
     seed: int | None = field(default=None, kw_only=True)
+    async_session: Any = field(default=None, kw_only=True)
 
     def try_generate_image(self, prompts: list[str], negative_prompts: list[str] | None = None) -> ImageArtifact:
-        request = self.image_generation_model_driver.text_to_image_request_parameters(
-            prompts, self.image_width, self.image_height, negative_prompts=negative_prompts, seed=self.seed
-        )
-
         response = self.bedrock_client.invoke_model(
-            body=json.dumps(request), modelId=self.model, accept="application/json", contentType="application/json"
+            body=self._build_request_body(prompts, negative_prompts),
+            modelId=self.model,
+            accept="application/json",
+            contentType="application/json",
         )
 
         response_body = json.loads(response.get("body").read())
 
+        return self._build_image_artifact(prompts, response_body)
+
+    async def atry_generate_image(self, prompts: list[str], negative_prompts: list[str] | None = None) -> ImageArtifact:
+        """Asynchronous counterpart of `try_generate_image`.
+
+        Uses `aioboto3` when it is installed so that many generations can be awaited concurrently on a single event
+        loop. Otherwise, the synchronous call is run in a worker thread.
+        """
+
+        if self.async_session is None:
+            try:
+                aioboto3 = import_optional_dependency("aioboto3")
+            except ImportError:
+                return await super().atry_generate_image(prompts, negative_prompts)
+
+            self.async_session = self._build_async_session(aioboto3)
+
+        async with self.async_session.client(
+            service_name="bedrock-runtime",
+            region_name=self.bedrock_client.meta.region_name,
+            endpoint_url=self.bedrock_client.meta.endpoint_url,
+            config=self.bedrock_client.meta.config,
+        ) as bedrock_client:
+            response = await bedrock_client.invoke_model(
+                body=self._build_request_body(prompts, negative_prompts),
+                modelId=self.model,
+                accept="application/json",
+                contentType="application/json",
+            )
+            response_body = json.loads(await response["body"].read())
+
+        return self._build_image_artifact(prompts, response_body)
+
+    def _build_async_session(self, aioboto3: Any) -> Any:
+        credentials = self.session.get_credentials()
+        if credentials is None:
+            raise ValueError(
+                "Unable to locate AWS credentials for `session`, configure them or provide `async_session`"
+            )
+
+        if credentials.method == "explicit":
+            return aioboto3.Session(
+                aws_access_key_id=credentials.access_key,
+                aws_secret_access_key=credentials.secret_key,
+                aws_session_token=credentials.token,
+                region_name=self.session.region_name,
+            )
+        else:
+            # Resolve the credential chain again in aioboto3 so that temporary credentials keep being refreshed.
+            profile_name = self.session.profile_name
+
+            return aioboto3.Session(
+                profile_name=None if profile_name == "default" else profile_name, region_name=self.session.region_name
+            )
+
+    def _build_request_body(self, prompts: list[str], negative_prompts: list[str] | None = None) -> str:
+        request = self.image_generation_model_driver.text_to_image_request_parameters(
+            prompts, self.image_width, self.image_height, negative_prompts=negative_prompts, seed=self.seed
+        )
+
+        return json.dumps(request)
+
+    def _build_image_artifact(self, prompts: list[str], response_body: dict) -> ImageArtifact:
         try:
             image_bytes = self.image_generation_model_driver.get_generated_image(response_body)
         except Exception as e:
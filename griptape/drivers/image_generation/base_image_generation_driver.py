@@ -1,5 +1,6 @@
+import asyncio
 from abc import abstractmethod, ABC
-from typing import Optional
+from typing import Optional, AsyncIterator
 
 from attr import define, field
 
@@ -16,6 +17,34 @@ class BaseImageGenerationDriver(ExponentialBackoffMixin, ABC):
             with attempt:
                 return self.try_generate_image(prompts=prompts, negative_prompts=negative_prompts)
 
+    async def agenerate_image(self, prompts: list[str], negative_prompts: Optional[list[str]] = None) -> ImageArtifact:
+        async for attempt in self.aretrying():
+            with attempt:
+                return await self.atry_generate_image(prompts=prompts, negative_prompts=negative_prompts)
+
+    async def generate_images_as_completed(
+        self, prompt_sets: list[list[str]], negative_prompts: Optional[list[str]] = None
+    ) -> AsyncIterator[ImageArtifact]:
+        """Generates one image per prompt set concurrently, yielding each image as soon as it is ready.
+
+        Images are yielded in completion order, not in the order of `prompt_sets`; use `ImageArtifact.prompt` to match
+        them up. Generations still pending when the consumer stops iterating are cancelled.
+        """
+
+        tasks = [asyncio.create_task(self.agenerate_image(prompts, negative_prompts)) for prompts in prompt_sets]
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
     @abstractmethod
     def try_generate_image(self, prompts: list[str], negative_prompts: Optional[list[str]] = None) -> ImageArtifact:
         ...
+
+    async def atry_generate_image(
+        self, prompts: list[str], negative_prompts: Optional[list[str]] = None
+    ) -> ImageArtifact:
+        return await asyncio.to_thread(self.try_generate_image, prompts, negative_prompts)
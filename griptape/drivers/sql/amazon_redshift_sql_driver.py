@@ -1,7 +1,10 @@
 from __future__ import annotations
 import time
+import warnings
+from concurrent import futures
 from typing import Optional, TYPE_CHECKING, Any
 from griptape.drivers import BaseSqlDriver
+from griptape.utils import botocore_client_config
 from attr import Factory, define, field
 
 if TYPE_CHECKING:
@@ -10,15 +13,51 @@ if TYPE_CHECKING:
 
 @define
 class AmazonRedshiftSqlDriver(BaseSqlDriver):
+    """SQL Driver for Amazon Redshift using the Redshift Data API.
+
+    Attributes:
+        database: Name of the database to query.
+        session: boto3 session.
+        cluster_identifier: Identifier of a provisioned cluster. Provide either this or `workgroup_name`.
+        workgroup_name: Name of a serverless workgroup. Provide either this or `cluster_identifier`.
+        db_user: Database user name.
+        database_credentials_secret_arn: ARN of the Secrets Manager secret holding the database credentials.
+        wait_for_query_completion_sec: Deprecated, use `initial_delay_sec`. Only sets the delay before the first
+            status poll; later polls back off up to `max_delay_sec`.
+        initial_delay_sec: Delay before the first status poll of a running statement.
+        max_delay_sec: Upper bound for the delay between status polls.
+        delay_multiplier: Factor the delay between status polls grows by after each poll.
+        max_pool_connections: Size of the HTTP connection pool used by the default Redshift Data API client.
+        futures_executor: Executor used by `execute_queries`.
+        client: Redshift Data API client.
+    """
+
     database: str = field(kw_only=True)
     session: boto3.Session = field(kw_only=True)
     cluster_identifier: str | None = field(default=None, kw_only=True)
     workgroup_name: str | None = field(default=None, kw_only=True)
     db_user: str | None = field(default=None, kw_only=True)
     database_credentials_secret_arn: str | None = field(default=None, kw_only=True)
-    wait_for_query_completion_sec: float = field(default=0.3, kw_only=True)
+    wait_for_query_completion_sec: float | None = field(default=None, kw_only=True)
+    initial_delay_sec: float = field(
+        default=Factory(
+            lambda self: 0.05 if self.wait_for_query_completion_sec is None else self.wait_for_query_completion_sec,
+            takes_self=True,
+        ),
+        kw_only=True,
+    )
+    max_delay_sec: float = field(default=2.0, kw_only=True)
+    delay_multiplier: float = field(default=1.7, kw_only=True)
+    max_pool_connections: int = field(default=50, kw_only=True)
+    futures_executor: futures.Executor = field(default=Factory(lambda: futures.ThreadPoolExecutor()), kw_only=True)
     client: Any = field(
-        default=Factory(lambda self: self.session.client("redshift-data"), takes_self=True), kw_only=True
+        default=Factory(
+            lambda self: self.session.client(
+                "redshift-data", config=botocore_client_config(self.max_pool_connections, retries={"mode": "adaptive"})
+            ),
+            takes_self=True,
+        ),
+        kw_only=True,
     )
 
     @workgroup_name.validator
@@ -28,13 +67,14 @@ class AmazonRedshiftSqlDriver(BaseSqlDriver):
         elif self.cluster_identifier and self.workgroup_name:
             raise ValueError("Provide a value for either `cluster_identifier` or `workgroup_name`, but not both")
 
-    @classmethod
-    def _process_rows_from_records(cls, records) -> list[list]:
-        return [[c[list(c.keys())[0]] for c in r] for r in records]
-
-    @classmethod
-    def _process_cells_from_rows_and_columns(cls, columns: list, rows: list[list]) -> list[dict[str, Any]]:
-        return [{column: r[idx] for idx, column in enumerate(columns)} for r in rows]
+    @wait_for_query_completion_sec.validator
+    def validate_wait_for_query_completion_sec(self, _, wait_for_query_completion_sec: float | None) -> None:
+        if wait_for_query_completion_sec is not None:
+            warnings.warn(
+                "`wait_for_query_completion_sec` is deprecated, use `initial_delay_sec` instead",
+                DeprecationWarning,
+                stacklevel=3,
+            )
 
     @classmethod
     def _process_columns_from_column_metadata(cls, meta) -> list:
@@ -43,8 +83,20 @@ class AmazonRedshiftSqlDriver(BaseSqlDriver):
     @classmethod
     def _post_process(cls, meta, records) -> list[dict[str, Any]]:
         columns = cls._process_columns_from_column_metadata(meta)
-        rows = cls._process_rows_from_records(records)
-        return cls._process_cells_from_rows_and_columns(columns, rows)
+        return [dict(zip(columns, (next(iter(c.values())) for c in r))) for r in records]
+
+    def _build_base_kwargs(self) -> dict[str, str]:
+        base_kwargs = {"Database": self.database}
+        if self.workgroup_name:
+            base_kwargs["WorkgroupName"] = self.workgroup_name
+        if self.cluster_identifier:
+            base_kwargs["ClusterIdentifier"] = self.cluster_identifier
+        if self.db_user:
+            base_kwargs["DbUser"] = self.db_user
+        if self.database_credentials_secret_arn:
+            base_kwargs["SecretArn"] = self.database_credentials_secret_arn
+
+        return base_kwargs
 
     def execute_query(self, query: str) -> list[BaseSqlDriver.RowResult] | None:
         rows = self.execute_query_raw(query)
@@ -53,52 +105,48 @@ class AmazonRedshiftSqlDriver(BaseSqlDriver):
         else:
             return None
 
+    def execute_queries(self, queries: list[str]) -> list[list[BaseSqlDriver.RowResult] | None]:
+        """Runs `queries` concurrently on `futures_executor` and returns their results in the same order.
+
+        Each query spends most of its time waiting on the Redshift Data API, so the default `ThreadPoolExecutor`
+        (capped at 32 workers) is usually enough; keep `max_pool_connections` at least as large as the worker count.
+        """
+
+        fs = [self.futures_executor.submit(self.execute_query, query) for query in queries]
+
+        return [future.result() for future in fs]
+
     def execute_query_raw(self, query: str) -> list[dict[str, Any]] | None:
-        function_kwargs = {"Sql": query, "Database": self.database}
-        if self.workgroup_name:
-            function_kwargs["WorkgroupName"] = self.workgroup_name
-        if self.cluster_identifier:
-            function_kwargs["ClusterIdentifier"] = self.cluster_identifier
-        if self.db_user:
-            function_kwargs["DbUser"] = self.db_user
-        if self.database_credentials_secret_arn:
-            function_kwargs["SecretArn"] = self.database_credentials_secret_arn
+        function_kwargs = {**self._build_base_kwargs(), "Sql": query}
 
         response = self.client.execute_statement(**function_kwargs)
         response_id = response["Id"]
 
         statement = self.client.describe_statement(Id=response_id)
 
+        delay = self.initial_delay_sec
         while statement["Status"] in ["SUBMITTED", "PICKED", "STARTED"]:
-            time.sleep(self.wait_for_query_completion_sec)
+            time.sleep(delay)
+            delay = min(delay * self.delay_multiplier, self.max_delay_sec)
             statement = self.client.describe_statement(Id=response_id)
 
         if statement["Status"] == "FINISHED":
-            statement_result = self.client.get_statement_result(Id=response_id)
-            results = statement_result.get("Records", [])
+            paginator = self.client.get_paginator("get_statement_result")
+            results = []
+            meta = None
 
-            while "NextToken" in statement_result:
-                statement_result = self.client.get_statement_result(
-                    Id=response_id, NextToken=statement_result["NextToken"]
-                )
-                results = results + response.get("Records", [])
+            for page in paginator.paginate(Id=response_id):
+                results.extend(page.get("Records", []))
+                meta = meta or page.get("ColumnMetadata")
 
-            return self._post_process(statement_result["ColumnMetadata"], results)
+            return self._post_process(meta, results)
 
         elif statement["Status"] in ["FAILED", "ABORTED"]:
             return None
 
     def get_table_schema(self, table: str, schema: str | None = None) -> str | None:
-        function_kwargs = {"Database": self.database, "Table": table}
+        function_kwargs = {**self._build_base_kwargs(), "Table": table}
         if schema:
             function_kwargs["Schema"] = schema
-        if self.workgroup_name:
-            function_kwargs["WorkgroupName"] = self.workgroup_name
-        if self.cluster_identifier:
-            function_kwargs["ClusterIdentifier"] = self.cluster_identifier
-        if self.db_user:
-            function_kwargs["DbUser"] = self.db_user
-        if self.database_credentials_secret_arn:
-            function_kwargs["SecretArn"] = self.database_credentials_secret_arn
         response = self.client.describe_table(**function_kwargs)
         return [col["name"] for col in response["ColumnList"]]
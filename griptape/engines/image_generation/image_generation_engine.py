@@ -1,6 +1,9 @@
+import itertools
+from concurrent import futures
 from typing import Optional
 
-from attr import field, define
+from attr import field, define, Factory
+from griptape.artifacts import ImageArtifact
 from griptape.drivers import BaseImageGenerationDriver
 from griptape.rules import Rule, Ruleset
 
@@ -8,6 +11,7 @@ from griptape.rules import Rule, Ruleset
 @define
 class ImageGenerationEngine:
     image_generation_driver: BaseImageGenerationDriver = field(kw_only=True)
+    futures_executor: futures.Executor = field(default=Factory(lambda: futures.ThreadPoolExecutor()), kw_only=True)
 
     def generate_image(
         self,
@@ -16,15 +20,40 @@ class ImageGenerationEngine:
         rulesets: Optional[list[Ruleset]] = None,
         negative_rulesets: Optional[list[Ruleset]] = None,
     ):
-        if not negative_prompts:
-            negative_prompts = []
+        prompts = self._merge(prompts, rulesets)
+        negative_prompts = self._merge(negative_prompts, negative_rulesets)
 
-        if rulesets is not None:
-            for ruleset in rulesets:
-                prompts += [rule.value for rule in ruleset.rules]
+        return self.image_generation_driver.generate_image(prompts, negative_prompts=negative_prompts)
+
+    def generate_images(
+        self,
+        prompt_sets: list[list[str]],
+        negative_prompts: Optional[list[str]] = None,
+        rulesets: Optional[list[Ruleset]] = None,
+        negative_rulesets: Optional[list[Ruleset]] = None,
+    ) -> list[ImageArtifact]:
+        """Generates one image per prompt set, running the driver calls concurrently on `futures_executor`.
 
-        if negative_rulesets is not None:
-            for negative_ruleset in negative_rulesets:
-                negative_prompts += [rule.value for rule in negative_ruleset.rules]
+        Image generation is network-bound, so the default `ThreadPoolExecutor` (capped at 32 workers) is usually
+        sufficient; pass a smaller executor to respect provider rate limits.
+        """
 
-        return self.image_generation_driver.generate_image(prompts, negative_prompts=negative_prompts)
+        ruleset_prompts = self._merge(None, rulesets)
+        negative_prompts = self._merge(negative_prompts, negative_rulesets)
+
+        fs = [
+            self.futures_executor.submit(
+                self.image_generation_driver.generate_image,
+                [*prompts, *ruleset_prompts],
+                negative_prompts=negative_prompts,
+            )
+            for prompts in prompt_sets
+        ]
+
+        return [future.result() for future in fs]
+
+    @staticmethod
+    def _merge(prompts: Optional[list[str]], rulesets: Optional[list[Ruleset]]) -> list[str]:
+        return list(
+            itertools.chain(prompts or (), (rule.value for ruleset in rulesets or () for rule in ruleset.rules))
+        )
@@ -11,6 +11,7 @@ from .prompt_stack import PromptStack
 from .dict_utils import remove_null_values_in_dict_recursively
 from .hash import str_to_hash
 from .import_utils import import_optional_dependency
+from .aws import botocore_client_config
 from .stream import Stream
 from .constants import Constants as constants
 
@@ -29,6 +30,7 @@ __all__ = [
     "Chat",
     "str_to_hash",
     "import_optional_dependency",
+    "botocore_client_config",
     "execute_futures_dict",
     "TokenCounter",
     "PromptStack",
@@ -0,0 +1,21 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+from .import_utils import import_optional_dependency
+
+if TYPE_CHECKING:
+    from botocore.config import Config
+
+
+def botocore_client_config(max_pool_connections: int, **kwargs: Any) -> Config:
+    """Builds a botocore client `Config` that keeps a pool of warm, kept-alive connections.
+
+    Args:
+        max_pool_connections: Maximum number of connections to keep in the client's pool.
+        kwargs: Any other `Config` options.
+    Returns:
+        The client configuration.
+    """
+
+    return import_optional_dependency("botocore.config").Config(
+        max_pool_connections=max_pool_connections, tcp_keepalive=True, **kwargs
+    )
@@ -1,7 +1,7 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Iterator
-from threading import Thread
-from queue import Queue
+from typing import TYPE_CHECKING, Iterator, Optional
+from threading import Event, Thread
+from queue import Empty, SimpleQueue
 from griptape.artifacts.text_artifact import TextArtifact
 from griptape.events.completion_chunk_event import CompletionChunkEvent
 from griptape.events.event_listener import EventListener
@@ -25,9 +25,16 @@ class Stream:
 
     Attributes:
         structure: The Structure to wrap.
-        _event_queue: A queue to hold events from the Structure.
+        _event_queue: A queue of `(event code, token)` pairs produced from the Structure's events.
+        _done: Set by the Structure's thread once it has stopped, whether or not it finished successfully.
+        _exception: The exception raised by the Structure's thread, re-raised by `run`.
     """
 
+    FINISH_STRUCTURE_RUN = 0
+    FINISH_PROMPT = 1
+    COMPLETION_CHUNK = 2
+    EVENT_QUEUE_TIMEOUT = 0.25
+
     structure: Structure = field()
 
     @structure.validator
@@ -35,31 +42,52 @@ class Stream:
         if structure and not structure.prompt_driver.stream:
             raise ValueError("prompt driver does not have streaming enabled, enable with stream=True")
 
-    _event_queue: Queue[BaseEvent] = field(default=Factory(lambda: Queue()))
+    _event_queue: SimpleQueue[tuple[int, Optional[str]]] = field(default=Factory(lambda: SimpleQueue()))
+    _done: Event = field(default=Factory(lambda: Event()), init=False)
+    _exception: Optional[BaseException] = field(default=None, init=False)
 
     def run(self, *args) -> Iterator[TextArtifact]:
+        self._done.clear()
+        self._exception = None
+
         t = Thread(target=self._run_structure, args=args)
         t.start()
 
-        while True:
-            event = self._event_queue.get()
-            if isinstance(event, FinishStructureRunEvent):
-                break
-            elif isinstance(event, FinishPromptEvent):
+        while not self._done.is_set() or not self._event_queue.empty():
+            try:
+                code, token = self._event_queue.get(timeout=self.EVENT_QUEUE_TIMEOUT)
+            except Empty:
+                continue
+
+            if code == self.COMPLETION_CHUNK:
+                yield TextArtifact(value=token)
+            elif code == self.FINISH_PROMPT:
                 yield TextArtifact(value="\n")
-            elif isinstance(event, CompletionChunkEvent):
-                yield TextArtifact(value=event.token)
+            else:
+                break
         t.join()
 
+        if self._exception is not None:
+            raise self._exception
+
     def _run_structure(self, *args):
         def event_handler(event: BaseEvent):
-            self._event_queue.put(event)
+            if isinstance(event, CompletionChunkEvent):
+                self._event_queue.put((self.COMPLETION_CHUNK, event.token))
+            elif isinstance(event, FinishPromptEvent):
+                self._event_queue.put((self.FINISH_PROMPT, None))
+            elif isinstance(event, FinishStructureRunEvent):
+                self._event_queue.put((self.FINISH_STRUCTURE_RUN, None))
 
         stream_event_listener = EventListener(
             event_handler, event_types=[CompletionChunkEvent, FinishPromptEvent, FinishStructureRunEvent]
         )
         self.structure.add_event_listener(stream_event_listener)
 
-        self.structure.run(*args)
-
-        self.structure.remove_event_listener(stream_event_listener)
+        try:
+            self.structure.run(*args)
+        except BaseException as e:
+            self._exception = e
+        finally:
+            self.structure.remove_event_listener(stream_event_listener)
+            self._done.set()
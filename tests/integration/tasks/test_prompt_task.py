@@ -4,6 +4,7 @@ from tests.utils.structure_runner import (
     run_structure,
     OUTPUT_RULESET,
     prompt_driver_id_fn,
+    get_prompt_driver,
 )
 import pytest
 
@@ -13,7 +14,9 @@ class TestPromptTask:
     def agent(self, request):
         from griptape.structures import Agent
 
-        return Agent(conversation_memory=None, prompt_driver=request.param, rulesets=[OUTPUT_RULESET])
+        return Agent(
+            conversation_memory=None, prompt_driver=get_prompt_driver(request.param), rulesets=[OUTPUT_RULESET]
+        )
 
     def test_prompt_task(self, agent):
         result = run_structure(agent, "Write a haiku about pirates. It must contain the word 'ship'.")
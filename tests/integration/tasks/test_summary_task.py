@@ -6,6 +6,7 @@ from tests.utils.structure_runner import (
     run_structure,
     OUTPUT_RULESET,
     prompt_driver_id_fn,
+    get_prompt_driver,
 )
 import pytest
 
@@ -15,8 +16,9 @@ class TestSummaryTask:
     def agent(self, request):
         from griptape.structures import Agent
 
-        agent = Agent(conversation_memory=None, prompt_driver=request.param, rulesets=[OUTPUT_RULESET])
-        agent.add_task(TextSummaryTask(summary_engine=PromptSummaryEngine(prompt_driver=request.param)))
+        prompt_driver = get_prompt_driver(request.param)
+        agent = Agent(conversation_memory=None, prompt_driver=prompt_driver, rulesets=[OUTPUT_RULESET])
+        agent.add_task(TextSummaryTask(summary_engine=PromptSummaryEngine(prompt_driver=prompt_driver)))
 
         return agent
 
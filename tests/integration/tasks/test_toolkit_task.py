@@ -4,6 +4,7 @@ from tests.utils.structure_runner import (
     run_structure,
     OUTPUT_RULESET,
     prompt_driver_id_fn,
+    get_prompt_driver,
 )
 import pytest
 
@@ -24,7 +25,7 @@ class TestToolkitTask:
                 WebScraper(),
             ],
             conversation_memory=None,
-            prompt_driver=request.param,
+            prompt_driver=get_prompt_driver(request.param),
             rulesets=[OUTPUT_RULESET],
         )
 
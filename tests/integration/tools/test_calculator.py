@@ -3,6 +3,7 @@ from tests.utils.structure_runner import (
     OUTPUT_RULESET,
     TOOLKIT_TASK_CAPABLE_PROMPT_DRIVERS,
     prompt_driver_id_fn,
+    get_prompt_driver,
 )
 from fuzzywuzzy import fuzz
 import pytest
@@ -15,7 +16,10 @@ class TestCalculator:
         from griptape.tools import Calculator
 
         return Agent(
-            tools=[Calculator()], conversation_memory=None, prompt_driver=request.param, rulesets=[OUTPUT_RULESET]
+            tools=[Calculator()],
+            conversation_memory=None,
+            prompt_driver=get_prompt_driver(request.param),
+            rulesets=[OUTPUT_RULESET],
         )
 
     def test_calculate(self, agent):
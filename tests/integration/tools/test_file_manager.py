@@ -4,6 +4,7 @@ from tests.utils.structure_runner import (
     run_structure,
     OUTPUT_RULESET,
     prompt_driver_id_fn,
+    get_prompt_driver,
 )
 import pytest
 
@@ -15,7 +16,10 @@ class TestFileManager:
         from griptape.tools import FileManager
 
         return Agent(
-            tools=[FileManager()], conversation_memory=None, prompt_driver=request.param, rulesets=[OUTPUT_RULESET]
+            tools=[FileManager()],
+            conversation_memory=None,
+            prompt_driver=get_prompt_driver(request.param),
+            rulesets=[OUTPUT_RULESET],
         )
 
     def test_save_content_to_disk(self, agent):
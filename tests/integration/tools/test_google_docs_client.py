@@ -5,6 +5,7 @@ from tests.utils.structure_runner import (
     OUTPUT_RULESET,
     TOOLKIT_TASK_CAPABLE_PROMPT_DRIVERS,
     prompt_driver_id_fn,
+    get_prompt_driver,
 )
 
 
@@ -33,7 +34,7 @@ class TestGoogleDocsClient:
                 )
             ],
             conversation_memory=None,
-            prompt_driver=request.param,
+            prompt_driver=get_prompt_driver(request.param),
             rulesets=[OUTPUT_RULESET],
         )
 
@@ -5,6 +5,7 @@ from tests.utils.structure_runner import (
     OUTPUT_RULESET,
     TOOLKIT_TASK_CAPABLE_PROMPT_DRIVERS,
     prompt_driver_id_fn,
+    get_prompt_driver,
 )
 
 
@@ -32,7 +33,7 @@ class TestGoogleDriveClient:
                     owner_email=os.environ["GOOGLE_OWNER_EMAIL"],
                 )
             ],
-            prompt_driver=request.param,
+            prompt_driver=get_prompt_driver(request.param),
             conversation_memory=None,
             rulesets=[OUTPUT_RULESET],
         )
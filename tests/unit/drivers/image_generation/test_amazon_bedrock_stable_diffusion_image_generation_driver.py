@@ -1,6 +1,8 @@
+import asyncio
 import io
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
+import boto3
 import pytest
 
 from griptape.drivers import AmazonBedrockImageGenerationDriver
@@ -35,6 +37,19 @@ class TestAmazonBedrockImageGenerationDriver:
     def test_init(self, driver):
         assert driver
 
+    def test_default_bedrock_client_config(self, model_driver):
+        driver = AmazonBedrockImageGenerationDriver(
+            session=boto3.Session(region_name="us-east-1"),
+            model="stability.stable-diffusion-xl-v1",
+            image_generation_model_driver=model_driver,
+            max_pool_connections=10,
+        )
+
+        config = driver.bedrock_client.meta.config
+        assert config.max_pool_connections == 10
+        assert config.tcp_keepalive
+        assert config.retries["total_max_attempts"] == 1
+
     def test_init_requires_image_generation_model_driver(self, session):
         with pytest.raises(TypeError):
             AmazonBedrockImageGenerationDriver(session=session, model="stability.stable-diffusion-xl-v1")
@@ -61,3 +76,102 @@ class TestAmazonBedrockImageGenerationDriver:
         assert image_artifact.height == 512
         assert image_artifact.model == "stability.stable-diffusion-xl-v1"
         assert image_artifact.prompt == "test prompt"
+
+    def test_atry_generate_image_closes_async_client(self, driver):
+        async_client = AsyncMock()
+        async_client.invoke_model.side_effect = lambda **kwargs: {
+            "body": AsyncMock(
+                read=AsyncMock(
+                    return_value=b"""{"artifacts": [{"finishReason": "SUCCESS", "base64": "aW1hZ2UgZGF0YQ=="}]}"""
+                )
+            )
+        }
+        driver.async_session = MagicMock()
+        driver.async_session.client.return_value.__aenter__.return_value = async_client
+
+        async def generate():
+            return [
+                await driver.atry_generate_image(prompts=["foo"]),
+                await driver.atry_generate_image(prompts=["bar"]),
+            ]
+
+        image_artifacts = asyncio.run(generate())
+
+        assert [a.prompt for a in image_artifacts] == ["foo", "bar"]
+        assert driver.async_session.client.call_count == 2
+        assert driver.async_session.client.call_args.kwargs["config"] == driver.bedrock_client.meta.config
+        assert driver.async_session.client.return_value.__aexit__.await_count == 2
+        assert async_client.invoke_model.call_count == 2
+
+    def test_atry_generate_image_without_credentials(self, driver, session, mocker):
+        mocker.patch(
+            "griptape.drivers.image_generation.amazon_bedrock_image_generation_driver.import_optional_dependency",
+            return_value=Mock(),
+        )
+        session.get_credentials.return_value = None
+
+        with pytest.raises(ValueError, match="Unable to locate AWS credentials"):
+            asyncio.run(driver.atry_generate_image(prompts=["test prompt"]))
+
+    def test_atry_generate_image_without_aioboto3(self, driver, mocker):
+        mocker.patch(
+            "griptape.drivers.image_generation.amazon_bedrock_image_generation_driver.import_optional_dependency",
+            side_effect=ImportError,
+        )
+        driver.bedrock_client.invoke_model.return_value = {
+            "body": io.BytesIO(b"""{"artifacts": [{"finishReason": "SUCCESS", "base64": "aW1hZ2UgZGF0YQ=="}]}""")
+        }
+
+        image_artifact = asyncio.run(driver.atry_generate_image(prompts=["test prompt"]))
+
+        assert image_artifact.value == b"image data"
+        assert image_artifact.prompt == "test prompt"
+
+    def test_generate_images_as_completed(self, driver, model_driver):
+        model_driver.text_to_image_request_parameters.side_effect = lambda prompts, *args, **kwargs: {
+            "prompts": prompts
+        }
+
+        async def invoke_model(**kwargs):
+            if "foo" in kwargs["body"]:
+                await asyncio.sleep(0.1)
+
+            return {
+                "body": AsyncMock(
+                    read=AsyncMock(
+                        return_value=b"""{"artifacts": [{"finishReason": "SUCCESS", "base64": "aW1hZ2UgZGF0YQ=="}]}"""
+                    )
+                )
+            }
+
+        async_client = AsyncMock()
+        async_client.invoke_model.side_effect = invoke_model
+        driver.async_session = MagicMock()
+        driver.async_session.client.return_value.__aenter__.return_value = async_client
+
+        async def collect():
+            return [a async for a in driver.generate_images_as_completed([["foo"], ["bar"]])]
+
+        image_artifacts = asyncio.run(collect())
+
+        assert [a.prompt for a in image_artifacts] == ["bar", "foo"]
+
+    def test_generate_images_as_completed_retries(self, driver, mocker):
+        mocker.patch(
+            "griptape.drivers.image_generation.amazon_bedrock_image_generation_driver.import_optional_dependency",
+            side_effect=ImportError,
+        )
+        driver.min_retry_delay = 0
+        driver.max_retry_delay = 0
+        driver.bedrock_client.invoke_model.side_effect = [
+            Exception("ThrottlingException"),
+            {"body": io.BytesIO(b"""{"artifacts": [{"finishReason": "SUCCESS", "base64": "aW1hZ2UgZGF0YQ=="}]}""")},
+        ]
+
+        async def collect():
+            return [a async for a in driver.generate_images_as_completed([["foo"]])]
+
+        image_artifacts = asyncio.run(collect())
+
+        assert [a.prompt for a in image_artifacts] == ["foo"]
+        assert driver.bedrock_client.invoke_model.call_count == 2
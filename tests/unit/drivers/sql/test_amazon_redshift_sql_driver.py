@@ -1,3 +1,4 @@
+from unittest.mock import Mock
 import pytest
 import boto3
 from botocore.stub import Stubber
@@ -124,6 +125,29 @@ class TestAmazonRedshiftSqlDriver:
     def test_amazon_redshift_sql_driver_parameter_validation_correct_params(self):
         AmazonRedshiftSqlDriver(database="dev", session=boto3.Session(region_name="us-east-1"), workgroup_name="dev")
 
+    def test_default_client_config(self):
+        driver = AmazonRedshiftSqlDriver(
+            database="dev",
+            session=boto3.Session(region_name="us-east-1"),
+            workgroup_name="dev",
+            max_pool_connections=10,
+        )
+
+        assert driver.client.meta.config.max_pool_connections == 10
+        assert driver.client.meta.config.tcp_keepalive
+
+    def test_wait_for_query_completion_sec_is_deprecated_alias(self):
+        with pytest.warns(DeprecationWarning) as record:
+            driver = AmazonRedshiftSqlDriver(
+                database="dev",
+                session=boto3.Session(region_name="us-east-1"),
+                workgroup_name="dev",
+                wait_for_query_completion_sec=0.3,
+            )
+
+        assert driver.initial_delay_sec == 0.3
+        assert record[0].filename == __file__
+
     def test_amazon_redshift_sql_driver_parameter_validation_missing_params(self):
         with pytest.raises(ValueError):
             AmazonRedshiftSqlDriver(database="dev", session=boto3.Session(region_name="us-east-1"))
@@ -137,12 +161,6 @@ class TestAmazonRedshiftSqlDriver:
                 cluster_identifier="dev",
             )
 
-    def test_process_rows_from_records(self):
-        assert AmazonRedshiftSqlDriver._process_rows_from_records(TestAmazonRedshiftSqlDriver.TEST_RECORDS) == [
-            ["Bob", "Ross"],
-            ["Tony", "Hawk"],
-        ]
-
     def test_process_columns_from_column_metadata(self):
         assert AmazonRedshiftSqlDriver._process_columns_from_column_metadata(
             TestAmazonRedshiftSqlDriver.TEST_COLUMN_METADATA
@@ -161,5 +179,76 @@ class TestAmazonRedshiftSqlDriver:
         rows = [{"first_name": "Bob", "last_name": "Ross"}, {"first_name": "Tony", "last_name": "Hawk"}]
         assert statement_driver.execute_query("query") == [BaseSqlDriver.RowResult(row) for row in rows]
 
+    def test_execute_query_raw_paginates(self):
+        session = boto3.Session(region_name="us-east-1")
+        client = session.client("redshift-data")
+        stubber = Stubber(client)
+        stubber.add_response("execute_statement", {"Id": "responseId"})
+        stubber.add_response("describe_statement", {"Id": "responseId", "Status": "FINISHED"}, {"Id": "responseId"})
+        stubber.add_response(
+            "get_statement_result",
+            {
+                "ColumnMetadata": TestAmazonRedshiftSqlDriver.TEST_COLUMN_METADATA,
+                "Records": TestAmazonRedshiftSqlDriver.TEST_RECORDS[:1],
+                "NextToken": "token",
+            },
+            {"Id": "responseId"},
+        )
+        stubber.add_response(
+            "get_statement_result",
+            {
+                "ColumnMetadata": TestAmazonRedshiftSqlDriver.TEST_COLUMN_METADATA,
+                "Records": TestAmazonRedshiftSqlDriver.TEST_RECORDS[1:],
+            },
+            {"Id": "responseId", "NextToken": "token"},
+        )
+        stubber.activate()
+
+        driver = AmazonRedshiftSqlDriver(database="dev", session=session, workgroup_name="dev", client=client)
+
+        assert driver.execute_query_raw("query") == [
+            {"first_name": "Bob", "last_name": "Ross"},
+            {"first_name": "Tony", "last_name": "Hawk"},
+        ]
+
+    def test_execute_query_raw_polls_with_backoff(self, mocker):
+        session = boto3.Session(region_name="us-east-1")
+        client = session.client("redshift-data")
+        stubber = Stubber(client)
+        stubber.add_response("execute_statement", {"Id": "responseId"})
+        for status in ["SUBMITTED", "STARTED", "STARTED", "FAILED"]:
+            stubber.add_response("describe_statement", {"Id": "responseId", "Status": status}, {"Id": "responseId"})
+        stubber.activate()
+        sleep = mocker.patch("time.sleep")
+
+        driver = AmazonRedshiftSqlDriver(
+            database="dev",
+            session=session,
+            workgroup_name="dev",
+            client=client,
+            initial_delay_sec=0.1,
+            max_delay_sec=0.3,
+            delay_multiplier=2,
+        )
+
+        assert driver.execute_query_raw("query") is None
+        assert [c.args[0] for c in sleep.call_args_list] == [0.1, 0.2, 0.3]
+
+    def test_execute_queries(self, statement_driver):
+        rows = [{"first_name": "Bob", "last_name": "Ross"}, {"first_name": "Tony", "last_name": "Hawk"}]
+        assert statement_driver.execute_queries(["query"]) == [[BaseSqlDriver.RowResult(row) for row in rows]]
+
+    def test_get_table_schema_uses_reassigned_attributes(self):
+        client = Mock()
+        client.describe_table.return_value = {"ColumnList": TestAmazonRedshiftSqlDriver.TEST_COLUMN_METADATA}
+        driver = AmazonRedshiftSqlDriver(
+            database="dev", session=boto3.Session(region_name="us-east-1"), workgroup_name="dev", client=client
+        )
+
+        driver.db_user = "user"
+        driver.get_table_schema("dev")
+
+        client.describe_table.assert_called_once_with(Database="dev", WorkgroupName="dev", DbUser="user", Table="dev")
+
     def test_get_table_schema(self, describe_table_driver):
         assert describe_table_driver.get_table_schema("dev") == ["first_name", "last_name"]
@@ -0,0 +1,50 @@
+from unittest.mock import Mock
+
+import pytest
+
+from griptape.artifacts import ImageArtifact
+from griptape.engines import ImageGenerationEngine
+from griptape.rules import Rule, Ruleset
+
+
+class TestImageGenerationEngine:
+    @pytest.fixture
+    def image_generation_driver(self):
+        driver = Mock()
+        driver.generate_image.side_effect = lambda prompts, negative_prompts=None: ImageArtifact(
+            prompt=", ".join(prompts), value=b"image data", mime_type="image/png", width=512, height=512, model="test"
+        )
+
+        return driver
+
+    @pytest.fixture
+    def engine(self, image_generation_driver):
+        return ImageGenerationEngine(image_generation_driver=image_generation_driver)
+
+    def test_generate_image(self, engine):
+        image_artifact = engine.generate_image(
+            ["foo"], rulesets=[Ruleset(name="test", rules=[Rule("bar")])], negative_prompts=["baz"]
+        )
+
+        assert image_artifact.prompt == "foo, bar"
+
+    def test_generate_image_does_not_mutate_prompts(self, engine):
+        prompts = ["foo"]
+        negative_prompts = ["baz"]
+
+        engine.generate_image(
+            prompts,
+            negative_prompts=negative_prompts,
+            rulesets=[Ruleset(name="test", rules=[Rule("bar")])],
+            negative_rulesets=[Ruleset(name="negative", rules=[Rule("qux")])],
+        )
+
+        assert prompts == ["foo"]
+        assert negative_prompts == ["baz"]
+
+    def test_generate_images(self, engine):
+        image_artifacts = engine.generate_images(
+            [["foo"], ["bar"]], rulesets=[Ruleset(name="test", rules=[Rule("baz")])]
+        )
+
+        assert [a.prompt for a in image_artifacts] == ["foo, baz", "bar, baz"]
@@ -1,4 +1,5 @@
 from typing import Iterator
+from unittest.mock import Mock
 import pytest
 from griptape.structures import Agent
 from griptape.utils import Stream
@@ -26,3 +27,13 @@ class TestStream:
         else:
             with pytest.raises(ValueError):
                 Stream(agent)
+
+    def test_run_reraises_structure_exception(self):
+        structure = Mock()
+        structure.prompt_driver.stream = True
+        structure.run.side_effect = ValueError("structure failed")
+
+        with pytest.raises(ValueError, match="structure failed"):
+            list(Stream(structure).run())
+
+        structure.remove_event_listener.assert_called_once()
@@ -1,9 +1,11 @@
 import os
 import re
+from functools import cache
 from json import loads
 from textwrap import dedent
 
 from griptape.drivers import (
+    BasePromptDriver,
     AmazonBedrockPromptDriver,
     AnthropicPromptDriver,
     BedrockClaudePromptModelDriver,
@@ -34,75 +36,104 @@ OUTPUT_RULESET = Ruleset(
 )
 
 
+@cache
+def get_boto3_session():
+    import boto3
+
+    return boto3.Session()
+
+
+@cache
+def get_bedrock_client():
+    return get_boto3_session().client("bedrock-runtime")
+
+
 PROMPT_DRIVERS = {
-    "OPENAI_CHAT_35": OpenAiChatPromptDriver(model="gpt-3.5-turbo", api_key=os.environ["OPENAI_API_KEY"]),
-    "OPENAI_CHAT_4": OpenAiChatPromptDriver(model="gpt-4", api_key=os.environ["OPENAI_API_KEY"]),
-    "OPENAI_COMPLETION_DAVINCI": OpenAiCompletionPromptDriver(
+    "OPENAI_CHAT_35": lambda: OpenAiChatPromptDriver(model="gpt-3.5-turbo", api_key=os.environ["OPENAI_API_KEY"]),
+    "OPENAI_CHAT_4": lambda: OpenAiChatPromptDriver(model="gpt-4", api_key=os.environ["OPENAI_API_KEY"]),
+    "OPENAI_COMPLETION_DAVINCI": lambda: OpenAiCompletionPromptDriver(
         api_key=os.environ["OPENAI_API_KEY"], model="text-davinci-003"
     ),
-    "AZURE_CHAT_35_16k": AzureOpenAiChatPromptDriver(
+    "AZURE_CHAT_35_16k": lambda: AzureOpenAiChatPromptDriver(
         api_key=os.environ["AZURE_OPENAI_API_KEY_1"],
         model="gpt-35-turbo-16k",
         azure_deployment=os.environ["AZURE_OPENAI_35_16k_DEPLOYMENT_ID"],
         azure_endpoint=os.environ["AZURE_OPENAI_API_BASE_1"],
     ),
-    "AZURE_COMPLETION_DAVINCI": AzureOpenAiCompletionPromptDriver(
+    "AZURE_COMPLETION_DAVINCI": lambda: AzureOpenAiCompletionPromptDriver(
         api_key=os.environ["AZURE_OPENAI_API_KEY_1"],
         model="text-davinci-003",
         azure_deployment=os.environ["AZURE_OPENAI_DAVINCI_DEPLOYMENT_ID"],
         azure_endpoint=os.environ["AZURE_OPENAI_API_BASE_1"],
     ),
-    "AZURE_CHAT_4": AzureOpenAiChatPromptDriver(
+    "AZURE_CHAT_4": lambda: AzureOpenAiChatPromptDriver(
         api_key=os.environ["AZURE_OPENAI_API_KEY_2"],
         model="gpt-4",
         azure_deployment=os.environ["AZURE_OPENAI_4_DEPLOYMENT_ID"],
         azure_endpoint=os.environ["AZURE_OPENAI_API_BASE_2"],
     ),
-    "AZURE_CHAT_4_32k": AzureOpenAiChatPromptDriver(
+    "AZURE_CHAT_4_32k": lambda: AzureOpenAiChatPromptDriver(
         api_key=os.environ["AZURE_OPENAI_API_KEY_2"],
         model="gpt-4-32k",
         azure_deployment=os.environ["AZURE_OPENAI_4_32k_DEPLOYMENT_ID"],
         azure_endpoint=os.environ["AZURE_OPENAI_API_BASE_2"],
     ),
-    "ANTHROPIC_CLAUDE_2": AnthropicPromptDriver(model="claude-2", api_key=os.environ["ANTHROPIC_API_KEY"]),
-    "COHERE_COMMAND": CoherePromptDriver(model="command", api_key=os.environ["COHERE_API_KEY"]),
-    "BEDROCK_TITAN": AmazonBedrockPromptDriver(
-        model="amazon.titan-tg1-large", prompt_model_driver=BedrockTitanPromptModelDriver()
+    "ANTHROPIC_CLAUDE_2": lambda: AnthropicPromptDriver(model="claude-2", api_key=os.environ["ANTHROPIC_API_KEY"]),
+    "COHERE_COMMAND": lambda: CoherePromptDriver(model="command", api_key=os.environ["COHERE_API_KEY"]),
+    "BEDROCK_TITAN": lambda: AmazonBedrockPromptDriver(
+        model="amazon.titan-tg1-large",
+        prompt_model_driver=BedrockTitanPromptModelDriver(),
+        session=get_boto3_session(),
+        bedrock_client=get_bedrock_client(),
     ),
-    "BEDROCK_CLAUDE_2": AmazonBedrockPromptDriver(
-        model="anthropic.claude-v2", prompt_model_driver=BedrockClaudePromptModelDriver()
+    "BEDROCK_CLAUDE_2": lambda: AmazonBedrockPromptDriver(
+        model="anthropic.claude-v2",
+        prompt_model_driver=BedrockClaudePromptModelDriver(),
+        session=get_boto3_session(),
+        bedrock_client=get_bedrock_client(),
     ),
-    "BEDROCK_J2": AmazonBedrockPromptDriver(
-        model="ai21.j2-ultra", prompt_model_driver=BedrockJurassicPromptModelDriver()
+    "BEDROCK_J2": lambda: AmazonBedrockPromptDriver(
+        model="ai21.j2-ultra",
+        prompt_model_driver=BedrockJurassicPromptModelDriver(),
+        session=get_boto3_session(),
+        bedrock_client=get_bedrock_client(),
     ),
-    "SAGEMAKER_LLAMA_7B": AmazonSageMakerPromptDriver(
+    "SAGEMAKER_LLAMA_7B": lambda: AmazonSageMakerPromptDriver(
         model=os.environ["SAGEMAKER_LLAMA_ENDPOINT_NAME"],
         prompt_model_driver=SageMakerLlamaPromptModelDriver(max_tokens=4096),
+        session=get_boto3_session(),
     ),
-    "SAGEMAKER_FALCON_7b": AmazonSageMakerPromptDriver(
-        model=os.environ["SAGEMAKER_FALCON_ENDPOINT_NAME"], prompt_model_driver=SageMakerFalconPromptModelDriver()
+    "SAGEMAKER_FALCON_7b": lambda: AmazonSageMakerPromptDriver(
+        model=os.environ["SAGEMAKER_FALCON_ENDPOINT_NAME"],
+        prompt_model_driver=SageMakerFalconPromptModelDriver(),
+        session=get_boto3_session(),
     ),
 }
 
 TOOLKIT_TASK_CAPABLE_PROMPT_DRIVERS = [
-    PROMPT_DRIVERS["OPENAI_CHAT_4"],
-    PROMPT_DRIVERS["OPENAI_CHAT_35"],
-    PROMPT_DRIVERS["AZURE_CHAT_35_16k"],
-    PROMPT_DRIVERS["AZURE_CHAT_4"],
-    PROMPT_DRIVERS["AZURE_CHAT_4_32k"],
-    PROMPT_DRIVERS["ANTHROPIC_CLAUDE_2"],
-    PROMPT_DRIVERS["BEDROCK_CLAUDE_2"],
+    "OPENAI_CHAT_4",
+    "OPENAI_CHAT_35",
+    "AZURE_CHAT_35_16k",
+    "AZURE_CHAT_4",
+    "AZURE_CHAT_4_32k",
+    "ANTHROPIC_CLAUDE_2",
+    "BEDROCK_CLAUDE_2",
 ]
 
-TOOL_TASK_CAPABLE_PROMPT_DRIVERS = PROMPT_DRIVERS.values()
+TOOL_TASK_CAPABLE_PROMPT_DRIVERS = list(PROMPT_DRIVERS.keys())
+
+PROMPT_TASK_CAPABLE_PROMPT_DRIVERS = list(PROMPT_DRIVERS.keys())
+
+SUMMARY_TASK_CAPABLE_PROMPT_DRIVERS = list(PROMPT_DRIVERS.keys())
 
-PROMPT_TASK_CAPABLE_PROMPT_DRIVERS = PROMPT_DRIVERS.values()
 
-SUMMARY_TASK_CAPABLE_PROMPT_DRIVERS = PROMPT_DRIVERS.values()
+@cache
+def get_prompt_driver(prompt_driver_key: str) -> BasePromptDriver:
+    return PROMPT_DRIVERS[prompt_driver_key]()
 
 
-def prompt_driver_id_fn(prompt_driver) -> str:
-    return f"{prompt_driver.__class__.__name__}-{prompt_driver.model}"
+def prompt_driver_id_fn(prompt_driver_key: str) -> str:
+    return prompt_driver_key
 
 
 def run_structure(structure, prompt) -> dict: